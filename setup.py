@@ -1,4 +1,4 @@
-from setuptools import setup
+from setuptools import setup, find_packages
 
 setup(
    name='Zero-Carbon-Aviation',
@@ -7,6 +7,6 @@ setup(
    author='David Tew',
    author_email='davetew@alum.mit.edu',
    url='https://github.com/davetew/Zero-Carbon-Aviation',
-   packages=setuptools.find_packages(),  #same as name
+   packages=find_packages(),  #same as name
    install_requires=['numpy', 'matplotlib','pandas','pint','cantera'], #external packages as dependencies
 )